@@ -0,0 +1,106 @@
+import os
+import statistics
+import sys
+import timeit
+
+from pdf_processor import PDFProcessor
+
+# Timed repetitions per engine and file; the first (warm-up) call is not timed
+REPEATS = 5
+
+
+def time_engines(engines, pdf_path, repeats=REPEATS):
+    """Time each engine on a PDF, warm, alternating the order every round
+
+    Returns ({name: pages}, {name: [seconds, ...]}).
+    """
+    # Warm-up: pays one-time library initialisation and fills the OS file cache
+    pages = {name: extract(pdf_path) for name, extract in engines}
+
+    timings = {name: [] for name, _ in engines}
+    for round_idx in range(repeats):
+        ordered = engines if round_idx % 2 == 0 else list(reversed(engines))
+        for name, extract in ordered:
+            timings[name].append(timeit.timeit(lambda f=extract: f(pdf_path), number=1))
+
+    return pages, timings
+
+
+def compare_file(processor, pdf_path, repeats=REPEATS):
+    """Compare PyMuPDF and PyPDF2 text extraction on a single PDF"""
+    engines = [
+        ('fitz', processor.extract_text_regular),
+        ('pypdf2', processor.extract_text_pypdf2),
+    ]
+    pages, timings = time_engines(engines, pdf_path, repeats)
+    fitz_pages, pypdf2_pages = pages['fitz'], pages['pypdf2']
+
+    matches = 0
+    mismatches = []
+    for fitz_page, pypdf2_page in zip(fitz_pages, pypdf2_pages):
+        fitz_name = processor.extract_employee_name(fitz_page['text'])
+        pypdf2_name = processor.extract_employee_name(pypdf2_page['text'])
+        if fitz_name == pypdf2_name:
+            matches += 1
+        else:
+            mismatches.append((fitz_page['page_num'], fitz_name, pypdf2_name))
+
+    return {
+        'pages': max(len(fitz_pages), len(pypdf2_pages)),
+        # Best-of-N is the least noisy estimate; median shown alongside
+        'fitz_time': min(timings['fitz']),
+        'pypdf2_time': min(timings['pypdf2']),
+        'fitz_median': statistics.median(timings['fitz']),
+        'pypdf2_median': statistics.median(timings['pypdf2']),
+        'matches': matches,
+        'mismatches': mismatches,
+    }
+
+
+def main():
+    pdf_files = sys.argv[1:]
+    if not pdf_files:
+        print("Usage: python compare_text_engines.py <file.pdf> [<file.pdf> ...]")
+        return 1
+
+    processor = PDFProcessor()
+    total_pages = total_matches = 0
+    total_fitz = total_pypdf2 = 0.0
+
+    print("Text engine comparison: PyMuPDF (fitz) vs PyPDF2")
+    print(f"Times are best of {REPEATS} warm runs (median in brackets)")
+    print("=" * 84)
+    print(f"{'File':<30} {'Pages':>6} {'fitz (s)':>16} {'PyPDF2 (s)':>16} {'Names agree':>12}")
+    print("-" * 84)
+
+    for pdf_path in pdf_files:
+        try:
+            result = compare_file(processor, pdf_path)
+        except Exception as e:
+            print(f"{os.path.basename(pdf_path):<30} error: {str(e)}")
+            continue
+
+        total_pages += result['pages']
+        total_matches += result['matches']
+        total_fitz += result['fitz_time']
+        total_pypdf2 += result['pypdf2_time']
+
+        fitz_col = f"{result['fitz_time']:.4f} ({result['fitz_median']:.4f})"
+        pypdf2_col = f"{result['pypdf2_time']:.4f} ({result['pypdf2_median']:.4f})"
+        print(f"{os.path.basename(pdf_path)[:30]:<30} {result['pages']:>6} "
+              f"{fitz_col:>16} {pypdf2_col:>16} "
+              f"{result['matches']:>5}/{result['pages']:<6}")
+        for page_num, fitz_name, pypdf2_name in result['mismatches']:
+            print(f"    page {page_num}: fitz={fitz_name!r} PyPDF2={pypdf2_name!r}")
+
+    print("-" * 84)
+    speedup = total_pypdf2 / total_fitz if total_fitz else 0.0
+    agreement = (total_matches / total_pages * 100) if total_pages else 0.0
+    print(f"{'Total':<30} {total_pages:>6} {total_fitz:>16.4f} {total_pypdf2:>16.4f} "
+          f"{total_matches:>5}/{total_pages:<6}")
+    print(f"fitz speedup (best-of-{REPEATS} totals): {speedup:.1f}x, name-match agreement: {agreement:.1f}%")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
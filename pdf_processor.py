@@ -8,6 +8,15 @@ from datetime import datetime
 
 
 class PDFProcessor:
+    # Plain text only: TEXTFLAGS_TEXT minus ligature and whitespace
+    # preservation, which extract_employee_name doesn't need since it
+    # collapses whitespace. TEXT_CID_FOR_UNKNOWN_UNICODE is kept so glyphs
+    # without a Unicode mapping come out the same as with the default flags.
+    REGULAR_TEXT_FLAGS = fitz.TEXT_MEDIABOX_CLIP | fitz.TEXT_CID_FOR_UNKNOWN_UNICODE
+
+    # Engines selectable via the 'text_engine' option of process_pdfs
+    TEXT_ENGINES = ('fitz', 'pypdf2')
+
     def __init__(self):
         pass
         
@@ -66,12 +75,44 @@ class PDFProcessor:
                 log_callback(f"Error in OCR processing: {str(e)}")
             raise
     
-    def extract_text_regular(self, pdf_path, log_callback=None):
-        """Extract text from PDF using regular text extraction"""
+    def extract_text_regular(self, pdf_path, log_callback=None, doc=None):
+        """Extract text from PDF using PyMuPDF's plain text extraction
+
+        Pass an already open fitz document as ``doc`` to reuse it; otherwise
+        the file is opened and closed here.
+        """
+        own_doc = doc is None
         try:
             if log_callback:
                 log_callback(f"Extracting text from PDF: {os.path.basename(pdf_path)}")
             
+            if own_doc:
+                doc = fitz.open(pdf_path)
+            extracted_pages = []
+            
+            for page_num, page in enumerate(doc):
+                text = page.get_text("text", flags=self.REGULAR_TEXT_FLAGS) or ""
+                extracted_pages.append({
+                    'page_num': page_num + 1,
+                    'text': text.strip()
+                })
+                
+            return extracted_pages
+                
+        except Exception as e:
+            if log_callback:
+                log_callback(f"Error in regular text extraction: {str(e)}")
+            raise
+        finally:
+            if own_doc and doc is not None:
+                doc.close()
+    
+    def extract_text_pypdf2(self, pdf_path, log_callback=None):
+        """Extract text from PDF using PyPDF2 (pure-Python fallback engine)"""
+        try:
+            if log_callback:
+                log_callback(f"Extracting text with PyPDF2: {os.path.basename(pdf_path)}")
+            
             with open(pdf_path, 'rb') as file:
                 reader = PdfReader(file)
                 extracted_pages = []
@@ -87,7 +128,7 @@ class PDFProcessor:
                 
         except Exception as e:
             if log_callback:
-                log_callback(f"Error in regular text extraction: {str(e)}")
+                log_callback(f"Error in PyPDF2 text extraction: {str(e)}")
             raise
     
     def extract_employee_name(self, text):
@@ -108,6 +149,16 @@ class PDFProcessor:
             progress_callback = options.get('progress_callback')
             log_callback = options.get('log_callback')
             ocr_enabled = options.get('ocr_enabled', True)
+            text_engine = options.get('text_engine')  # 'fitz', 'pypdf2' or None
+            if text_engine is not None:
+                text_engine = str(text_engine).strip().lower()
+                if text_engine not in self.TEXT_ENGINES:
+                    raise ValueError(f"Unknown text engine: {options.get('text_engine')!r} "
+                                     f"(expected one of {', '.join(self.TEXT_ENGINES)})")
+            # Without OCR default to PyMuPDF; when OCR fails default to PyPDF2,
+            # a different parser than the one that just failed
+            regular_engine = text_engine or 'fitz'
+            fallback_engine = text_engine or 'pypdf2'
             create_zip = options.get('create_zip', True)
             output_folder = options.get('output_folder')
 
@@ -124,9 +175,14 @@ class PDFProcessor:
             if log_callback:
                 log_callback(f"Starting to process {total_files} PDF files")
                 log_callback(f"OCR enabled: {ocr_enabled}")
+                if ocr_enabled:
+                    log_callback(f"Fallback text engine: {fallback_engine}")
+                else:
+                    log_callback(f"Text engine: {regular_engine}")
 
             # Process each PDF file
             for file_idx, pdf_path in enumerate(pdf_files):
+                doc = None
                 try:
                     if log_callback:
                         log_callback(f"Processing file {file_idx + 1}/{total_files}: {os.path.basename(pdf_path)}")
@@ -136,20 +192,30 @@ class PDFProcessor:
                     if progress_callback:
                         progress_callback(base_progress, f"Processing {os.path.basename(pdf_path)}")
 
-                    # Extract text based on OCR setting
+                    # Extract text based on OCR and engine settings
+                    pages_data = None
                     if ocr_enabled:
                         try:
                             pages_data = self.extract_text_with_ocr(pdf_path, log_callback)
                         except Exception as e:
                             if log_callback:
-                                log_callback(f"OCR failed, falling back to regular extraction: {str(e)}")
-                            pages_data = self.extract_text_regular(pdf_path, log_callback)
-                    else:
-                        pages_data = self.extract_text_regular(pdf_path, log_callback)
+                                log_callback(f"OCR failed, falling back to {fallback_engine} extraction: {str(e)}")
+                            if fallback_engine == 'pypdf2':
+                                pages_data = self.extract_text_pypdf2(pdf_path, log_callback)
+                    elif regular_engine == 'pypdf2':
+                        pages_data = self.extract_text_pypdf2(pdf_path, log_callback)
 
-                    # Get page dimensions using PyMuPDF
-                    import fitz
+                    # Opened once; reused for fitz extraction and page dimensions
                     doc = fitz.open(pdf_path)
+                    if pages_data is None:
+                        try:
+                            pages_data = self.extract_text_regular(pdf_path, log_callback, doc)
+                        except Exception as e:
+                            if log_callback:
+                                log_callback(f"PyMuPDF extraction failed, trying PyPDF2: {str(e)}")
+                            pages_data = self.extract_text_pypdf2(pdf_path, log_callback)
+
+                    # Get page dimensions using PyMuPDF
                     first_page_rect = doc[0].rect if len(doc) > 0 else None
 
                     previous_name = "Unknown"
@@ -182,13 +248,14 @@ class PDFProcessor:
                             "pdf_file": pdf_path
                         })
 
-                    doc.close()
-
                 except Exception as e:
                     if log_callback:
                         log_callback(f"Error processing file {pdf_path}: {str(e)}")
                     # Continue with next file
                     continue
+                finally:
+                    if doc is not None:
+                        doc.close()
 
             if not all_rows:
                 return {"success": False, "error": "No pages were successfully processed"}